@@ -62,8 +62,8 @@ def _raw_has_values(row: dict, columns: Iterable[str]) -> bool:
 
 def canonicalize_cache_frame(df: pd.DataFrame, tzname: str = "Asia/Tehran") -> pd.DataFrame:
     rows = []
-    for _, row in df.fillna("").iterrows():
-        raw = {column: clean(value) for column, value in row.to_dict().items()}
+    for record in df.fillna("").to_dict("records"):
+        raw = {column: clean(value) for column, value in record.items()}
         raw_legacy = _raw_has_values(raw, LEGACY_COLUMNS)
         raw_canonical = _raw_has_values(raw, CANONICAL_COLUMNS)
         schema_source = "legacy" if raw_legacy and not raw_canonical else ("canonical" if raw_canonical else "unknown")
@@ -85,15 +85,6 @@ def canonicalize_cache_frame(df: pd.DataFrame, tzname: str = "Asia/Tehran") -> p
     return result
 
 
-def _parse_iso_date(value: str | None) -> pd.Timestamp | None:
-    if not clean(value):
-        return None
-    try:
-        return pd.to_datetime(value, utc=False, errors="coerce")
-    except Exception:
-        return None
-
-
 def _canonical_datetime_series(df: pd.DataFrame) -> pd.Series:
     series = df["datetime_local"].fillna("").astype(str).str.strip()
     if "DateTime" in df.columns:
@@ -124,16 +115,19 @@ def validate_cache_frame(df: pd.DataFrame, start: str | datetime, end: str | dat
     valid_datetime_rows = canonical["datetime_local"].fillna("").astype(str).str.strip().ne("").sum()
     missing_datetime_rows = total_rows - int(valid_datetime_rows)
 
-    valid_dates = pd.to_datetime(canonical["date"], errors="coerce").dropna()
+    # Parse the date column once; the range mask and both min/max reports reuse it.
+    # Canonical dates are ISO strings, so name the format instead of letting pandas infer it.
+    parsed_dates = pd.to_datetime(canonical["date"], errors="coerce", format="ISO8601")
+    valid_dates = parsed_dates.dropna()
     min_date = valid_dates.min().date().isoformat() if not valid_dates.empty else None
     max_date = valid_dates.max().date().isoformat() if not valid_dates.empty else None
 
     start_ts = pd.Timestamp(start).date()
     end_ts = pd.Timestamp(end).date()
-    range_mask = pd.to_datetime(canonical["date"], errors="coerce").dt.date.between(start_ts, end_ts)
+    range_mask = parsed_dates.dt.date.between(start_ts, end_ts)
     range_df = canonical.loc[range_mask].copy()
     range_rows = len(range_df)
-    range_dates = pd.to_datetime(range_df["date"], errors="coerce").dropna()
+    range_dates = parsed_dates.loc[range_mask].dropna()
     range_min_date = range_dates.min().date().isoformat() if not range_dates.empty else None
     range_max_date = range_dates.max().date().isoformat() if not range_dates.empty else None
 
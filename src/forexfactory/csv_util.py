@@ -1,7 +1,12 @@
 # src/forexfactory/csv_util.py
 
+import csv
+import io
+import json
 import os
 import tempfile
+from datetime import date
+
 import pandas as pd
 
 import logging
@@ -14,13 +19,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Write the cache through a large block buffer; pandas emits many small writes.
+WRITE_BUFFER_SIZE = 1 << 20
+# Block size used when reading the cache backwards from its end.
+TAIL_CHUNK_SIZE = 8192
+# Every writer (header, full rewrite, append) uses the same terminator on all platforms,
+# so appended rows match a rewrite byte for byte.
+CSV_LINE_TERMINATOR = "\n"
+
 def ensure_csv_header(csv_file):
     """
     Ensure that the CSV file exists with the proper header.
+
+    A single stat decides whether anything needs writing; an existing but empty
+    file gets the header too.
     """
-    if not os.path.exists(csv_file):
-        df = pd.DataFrame(columns=CSV_COLUMNS)
-        df.to_csv(csv_file, index=False)
+    try:
+        if os.path.getsize(csv_file) > 0:
+            return
+    except OSError:
+        pass
+    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator=CSV_LINE_TERMINATOR).writerow(CSV_COLUMNS)
 
 
 def read_existing_data(csv_file):
@@ -29,18 +49,166 @@ def read_existing_data(csv_file):
     """
     if os.path.exists(csv_file):
         try:
-            df = pd.read_csv(csv_file, dtype=str)
+            # Every column is text and blanks mean "no value", so skip NA detection; this is
+            # faster and keeps literal values such as "N/A" in Forecast/Previous intact.
+            df = pd.read_csv(csv_file, dtype=str, na_filter=False)
             # Ensure all columns exist in the DataFrame
             for col in CSV_COLUMNS:
                 if col not in df.columns:
                     df[col] = ""
             return normalize_calendar_frame(df)
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # Unreadable or malformed files (ValueError covers pandas parser and
+            # decoding errors); anything else is a bug and should surface.
             logger.warning("Error reading CSV %s: %s", csv_file, e)
             return pd.DataFrame(columns=CSV_COLUMNS)
     else:
         return pd.DataFrame(columns=CSV_COLUMNS)
 
+def csv_meta_path(csv_file) -> str:
+    """Path of the sidecar file that records the cache's last DateTime and row count."""
+    return f"{csv_file}.meta.json"
+
+
+def read_csv_meta(csv_file):
+    """
+    Return the sidecar metadata for csv_file, or None if it is missing or stale.
+
+    The metadata is only trusted while the CSV still has the size and modification
+    time recorded when the metadata was written.
+    """
+    try:
+        with open(csv_meta_path(csv_file), encoding="utf-8") as f:
+            meta = json.load(f)
+        stat = os.stat(csv_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("size") != stat.st_size or meta.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+    return meta
+
+
+def write_csv_meta(csv_file, last_datetime: str, last_datetime_local: str, row_count: int | None):
+    """Atomically record the cache's last DateTime and row count next to it."""
+    stat = os.stat(csv_file)
+    meta = {
+        "last_datetime": last_datetime,
+        "last_datetime_local": last_datetime_local,
+        "row_count": row_count,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    meta_path = csv_meta_path(csv_file)
+    fd, tmp_path = tempfile.mkstemp(prefix=".forexfactory-", suffix=".json", dir=os.path.dirname(os.path.abspath(meta_path)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_csv_header(csv_file) -> list[str]:
+    with open(csv_file, encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader([f.readline()]), [])
+
+
+def _last_csv_record(tail: bytes, width: int, complete: bool):
+    """
+    Return the last record in tail, or None if tail does not reach back to its start yet.
+
+    Only b"\n" can end a record, and only outside a quoted field. The final terminator
+    is a record boundary, so a newline inside tail is one exactly when an even number
+    of quote characters follows it. Raises ValueError if the last record cannot be
+    determined (malformed file).
+    """
+    body = tail[:-1] if tail.endswith(b"\n") else tail
+    quotes_after = 0
+    end = len(body)
+    start = None
+    while True:
+        newline = body.rfind(b"\n", 0, end)
+        quotes_after += body.count(b'"', newline + 1, end)
+        if newline == -1:
+            break
+        if quotes_after % 2 == 0:
+            start = newline + 1
+            break
+        end = newline
+    if start is None:
+        if not complete:
+            return None
+        if quotes_after % 2:
+            raise ValueError("unbalanced quotes in CSV data")
+        start = 0
+    rows = list(csv.reader(io.StringIO(body[start:].decode("utf-8", "replace"), newline="")))
+    if len(rows) != 1 or len(rows[0]) != width:
+        raise ValueError("last CSV record does not match the header")
+    return rows[0]
+
+
+# Returned by _last_cache_datetimes when the cache has data rows but the last one could
+# not be located from the tail (None means there are no data rows).
+_LAST_ROW_UNKNOWN = object()
+
+
+def _last_cache_datetimes(csv_file):
+    """
+    Return (DateTime, datetime_local) of the last row of csv_file, None if it has no rows,
+    or _LAST_ROW_UNKNOWN if the last row could not be determined from the tail.
+
+    The sidecar metadata written by write_data_to_csv is used when it is current.
+    Otherwise the file is read backwards from its end in TAIL_CHUNK_SIZE blocks,
+    so the cost does not grow with the size of the cache.
+    """
+    meta = read_csv_meta(csv_file)
+    if meta is not None:
+        if not meta.get("last_datetime") and not meta.get("last_datetime_local"):
+            return None
+        return meta.get("last_datetime") or "", meta.get("last_datetime_local") or ""
+    with open(csv_file, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        data_start = f.tell()
+        position = f.seek(0, os.SEEK_END)
+        tail = b""
+        record = None
+        while record is None and position > data_start:
+            step = min(TAIL_CHUNK_SIZE, position - data_start)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            try:
+                record = _last_csv_record(tail, len(header), complete=position == data_start)
+            except ValueError:
+                return _LAST_ROW_UNKNOWN
+    if record is None:
+        return None
+    return _record_datetimes(header, record)
+
+
+def _record_datetimes(header, record):
+    row = dict(zip(header, record))
+    return row.get("DateTime", ""), row.get("datetime_local") or row.get("DateTime", "")
+
+
+def get_cached_days(csv_file) -> set[date]:
+    """
+    Return the set of local calendar days that have at least one row in the CSV cache.
+    """
+    days = set()
+    if not os.path.exists(csv_file):
+        return days
+    with open(csv_file, encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            value = (row.get("datetime_local") or row.get("DateTime") or "").strip()
+            try:
+                days.add(date.fromisoformat(value[:10]))
+            except ValueError:
+                continue
+    return days
+
+
 def write_data_to_csv(df: pd.DataFrame, csv_file: str):
     """
     Write final merged data to CSV, overwriting it.
@@ -49,13 +217,54 @@ def write_data_to_csv(df: pd.DataFrame, csv_file: str):
     directory = os.path.dirname(os.path.abspath(csv_file)) or "."
     os.makedirs(directory, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(prefix=".forexfactory-", suffix=".csv", dir=directory)
-    os.close(fd)
     try:
-        df.to_csv(tmp_path, index=False)
+        with os.fdopen(fd, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            df.to_csv(f, index=False, lineterminator=CSV_LINE_TERMINATOR)
         os.replace(tmp_path, csv_file)
     finally:
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
+    last = df.iloc[-1] if not df.empty else {"DateTime": "", "datetime_local": ""}
+    write_csv_meta(csv_file, last["DateTime"], last["datetime_local"], len(df))
+
+
+def append_data_to_csv(df: pd.DataFrame, csv_file: str) -> int | None:
+    """
+    Append rows to the cache without reading or rewriting it, when that is safe.
+
+    This is only done when the cache already uses the CSV_COLUMNS header and every new
+    row sorts after its last row, so the result is identical to a full merge and
+    rewrite. Returns the number of rows written (after normalization and
+    deduplication), or None without touching the file otherwise.
+    """
+    if not os.path.exists(csv_file) or _read_csv_header(csv_file) != CSV_COLUMNS:
+        return None
+    with open(csv_file, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            return None
+    df = normalize_calendar_frame(df)
+    if df.empty:
+        return 0
+    last = _last_cache_datetimes(csv_file)
+    if last is _LAST_ROW_UNKNOWN:
+        # Without a reliable last row the ordering check below cannot be made.
+        return None
+    # Rows written here keep DateTime == datetime_local, so comparing against the last
+    # row's sort keys also rules out (DateTime, Currency, Event) collisions.
+    if last is not None and df["datetime_local"].min() <= max(last):
+        return None
+
+    meta = read_csv_meta(csv_file)
+    # Serialize the rows first and append them with a single write, so an interrupted
+    # run is unlikely to leave a partial row behind.
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator=CSV_LINE_TERMINATOR).writerows(df.itertuples(index=False, name=None))
+    with open(csv_file, "a", newline="", encoding="utf-8") as f:
+        f.write(buffer.getvalue())
+    row_count = meta["row_count"] + len(df) if meta and meta.get("row_count") is not None else None
+    write_csv_meta(csv_file, df["DateTime"].iloc[-1], df["datetime_local"].iloc[-1], row_count)
+    return len(df)
 
 
 def normalize_calendar_frame(df: pd.DataFrame) -> pd.DataFrame:
@@ -132,24 +341,16 @@ def merge_new_data(existing_df, new_df):
     existing_df.set_index('unique_key', inplace=True)
     new_df.set_index('unique_key', inplace=True)
 
-    # Accumulate new rows that are not present in existing_df
-    new_rows_list = []
-    for key, new_row in new_df.iterrows():
-        if key in existing_df.index:
-            # Retrieve the 'Detail' field for comparison
-            existing_detail = str(existing_df.at[key, "Detail"]).strip() if pd.notna(existing_df.at[key, "Detail"]) else ""
-            new_detail = str(new_row["Detail"]).strip() if pd.notna(new_row["Detail"]) else ""
-            # Update the 'Detail' field only if it is missing in the existing record
-            # and if the new row contains detail data.
-            if not existing_detail and new_detail:
-                existing_df.at[key, "Detail"] = new_detail
-        else:
-            new_rows_list.append(new_row)
-
-    if new_rows_list:
-        new_rows_df = pd.DataFrame(new_rows_list)
-        # Concatenate new rows with the existing DataFrame
-        existing_df = pd.concat([existing_df, new_rows_df])
+    # Fill in missing details for records that already exist, in one vectorized step.
+    # normalize_calendar_frame has already stripped every value and removed NaNs.
+    missing_detail = existing_df["Detail"].eq("") & existing_df.index.isin(new_df.index)
+    if missing_detail.any():
+        existing_df.loc[missing_detail, "Detail"] = new_df.loc[existing_df.index[missing_detail], "Detail"].values
+
+    # Append the records that are not present in existing_df
+    new_only = new_df[~new_df.index.isin(existing_df.index)]
+    if not new_only.empty:
+        existing_df = pd.concat([existing_df, new_only])
 
     # Reset the index and ensure the DataFrame has the original column order
     merged_df = existing_df.reset_index(drop=True)
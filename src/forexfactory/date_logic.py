@@ -2,19 +2,25 @@
 
 from datetime import datetime
 
+# Lower-case month abbreviations as used in ForexFactory URLs (strftime('%b') is locale-dependent).
+_MONTH_ABBR = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+
 def build_url_for_partial_range(start_dt: datetime, end_dt: datetime) -> str:
     """
     Builds a ForexFactory calendar param of the form: ?range=dec20.2024-dec30.2024
     """
     def ff_str(d: datetime):
-        return d.strftime('%b').lower() + str(d.day) + '.' + str(d.year)
+        return f"{_MONTH_ABBR[d.month - 1]}{d.day}.{d.year}"
     return "range=" + ff_str(start_dt) + "-" + ff_str(end_dt)
 
 def build_url_for_full_month(year: int, month: int) -> str:
     """
     Builds a param like: ?month=jan.2025
     """
-    dt = datetime(year, month, 1)
-    m_str = dt.strftime('%b').lower()
-    y_str = dt.strftime('%Y')
-    return "month=" + m_str + "." + y_str
+    return f"month={_MONTH_ABBR[month - 1]}.{year}"
+
+def ff_week_date(d: datetime) -> str:
+    """
+    Formats the date of a ?week= param, e.g. apr07.2025
+    """
+    return f"{_MONTH_ABBR[d.month - 1]}{d.day:02d}.{d.year}"
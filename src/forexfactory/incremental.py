@@ -1,8 +1,10 @@
 import logging
+import re
 
 import pandas as pd
 
-from .csv_util import ensure_csv_header, read_existing_data, merge_new_data, write_data_to_csv
+from .csv_util import append_data_to_csv, ensure_csv_header, read_existing_data, merge_new_data, write_data_to_csv
+from .normalizer import CSV_COLUMNS
 from .providers import EconomicCalendarProvider, ForexFactoryHtmlProvider
 
 logging.basicConfig(
@@ -28,28 +30,35 @@ def scrape_incremental(
     Fetch a requested date range with the chosen provider and merge it into the CSV cache.
     The merge is idempotent and preserves historical rows outside the requested range.
     """
-    ensure_csv_header(output_csv)
-    existing_df = read_existing_data(output_csv)
     provider = provider or ForexFactoryHtmlProvider()
     provider_kwargs = dict(provider_kwargs or {})
     provider_kwargs.setdefault("scrape_details", scrape_details)
 
     events = provider.fetch_events(from_date, to_date, tzname, **provider_kwargs)
-    df_new = pd.DataFrame(events)
-    if df_new.empty:
-        logger.info("Provider returned no events; CSV unchanged.")
-        write_data_to_csv(existing_df, output_csv)
-        return
+    # Provider events are normalized to CSV_COLUMNS, so build the frame column by column
+    # rather than having pandas transpose a list of row dicts.
+    df_new = pd.DataFrame({column: [event.get(column, "") for event in events] for column in CSV_COLUMNS})
 
     if impact_filter and "impact" in df_new.columns:
-        import re
-
         pattern = "|".join(re.escape(i) for i in impact_filter)
         df_new = df_new[df_new["impact"].fillna("").astype(str).str.lower().str.contains(pattern, regex=True)]
     if keep_currencies and "currency" in df_new.columns:
         keep = {currency.upper() for currency in keep_currencies}
         df_new = df_new[df_new["currency"].fillna("").astype(str).str.upper().isin(keep)]
 
+    if df_new.empty:
+        # Nothing to merge: leave an existing cache untouched instead of rewriting it.
+        logger.info("No provider events to merge; CSV unchanged.")
+        ensure_csv_header(output_csv)
+        return
+
+    appended = append_data_to_csv(df_new, output_csv)
+    if appended is not None:
+        # Every row is newer than the cache, so there is nothing to merge.
+        logger.info("Done. Appended %s provider rows.", appended)
+        return
+
+    existing_df = read_existing_data(output_csv)
     merged_df = merge_new_data(existing_df, df_new)
     write_data_to_csv(merged_df, output_csv)
     logger.info("Done. Added/updated %s provider rows.", max(len(merged_df) - len(existing_df), 0))
@@ -1,9 +1,10 @@
 import argparse
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from dateutil.tz import gettz
 
+from .csv_util import get_cached_days
 from .incremental import scrape_incremental
 from .providers import ForexFactoryExportProvider, ForexFactoryHtmlProvider, ProviderError, SavedHtmlProvider
 
@@ -34,6 +35,9 @@ def build_parser():
         help="Export format for --provider forexfactory-export",
     )
     parser.add_argument("--input", type=str, default=None, help="Saved HTML input path for --provider saved-html")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent page fetches for --provider forexfactory-html")
+    parser.add_argument("--http-cache", type=str, default=None, help="Directory for conditional-GET page cache (--provider forexfactory-html)")
+    parser.add_argument("--resume", action="store_true", help="Start from the day of the last cached row when it is later than --start")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     return parser
 
@@ -57,9 +61,35 @@ def _resolve_dates(args, parser):
     return from_date, to_date
 
 
+def _resume_start(csv_file, from_date, to_date):
+    """
+    Move from_date past the leading weeks of the range that the cache already covers.
+
+    ForexFactory is fetched a week at a time, so a week counts as covered when the cache
+    has rows in it and in the following week (the last cached week may be partial and
+    is fetched again). Skipping stops at the first week without rows, and nothing is
+    skipped unless the cache starts on or before from_date.
+    """
+    days = get_cached_days(csv_file)
+    if not days or min(days) > from_date.date():
+        return from_date
+    weeks = {day - timedelta(days=day.weekday()) for day in days}
+    week = from_date.date() - timedelta(days=from_date.weekday())
+    next_week = week + timedelta(days=7)
+    while week in weeks and next_week in weeks and next_week <= to_date.date():
+        week, next_week = next_week, next_week + timedelta(days=7)
+    if week <= from_date.date():
+        return from_date
+    resumed = datetime(week.year, week.month, week.day, tzinfo=from_date.tzinfo)
+    logger.info("Resuming from %s; earlier weeks of the range are already cached.", week.isoformat())
+    return resumed
+
+
 def _build_provider(args):
+    if args.workers < 1:
+        raise ValueError("--workers must be at least 1")
     if args.provider == "forexfactory-html":
-        return ForexFactoryHtmlProvider(debug=args.debug)
+        return ForexFactoryHtmlProvider(debug=args.debug, max_workers=args.workers, cache_dir=args.http_cache)
     if args.provider == "saved-html":
         if not args.input:
             raise ValueError("--input is required with --provider saved-html")
@@ -88,6 +118,8 @@ def main(argv=None):
 
     impact_filter = [i.strip().lower() for i in args.impact.split(",")] if args.impact else None
     from_date, to_date = _resolve_dates(args, parser)
+    if args.resume:
+        from_date = _resume_start(args.csv, from_date, to_date)
 
     try:
         provider = _build_provider(args)
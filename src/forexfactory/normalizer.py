@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import re
+from datetime import date, datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Iterable
 
 from dateutil import parser as date_parser
@@ -27,21 +29,58 @@ NORMALIZED_COLUMNS = [
 LEGACY_COLUMNS = ["DateTime", "Currency", "Impact", "Event", "Actual", "Forecast", "Previous", "Detail"]
 CSV_COLUMNS = LEGACY_COLUMNS + NORMALIZED_COLUMNS
 
+_CLOCK_RE = re.compile(r"(\d{1,2}):(\d{2})\s*([ap])m")
+
 
 def clean(value) -> str:
     return "" if value is None else str(value).strip()
 
 
+@lru_cache(maxsize=1024)
+def _parse_clock(text: str) -> tuple[int, int] | None:
+    """
+    Convert a calendar clock string such as "8:30am" into (hour, minute).
+    Calendars only use a few dozen distinct slots, so results are cached.
+    """
+    match = _CLOCK_RE.fullmatch(text.lower())
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if not 1 <= hour <= 12 or minute > 59:
+        return None
+    return hour % 12 + (12 if match.group(3) == "p" else 0), minute
+
+
+def _parse_date_and_clock(date_text: str, time_text: str) -> datetime | None:
+    clock = _parse_clock(time_text)
+    if clock is None or len(date_text) != 10:
+        return None
+    try:
+        day = date.fromisoformat(date_text)
+    except ValueError:
+        return None
+    return datetime(day.year, day.month, day.day, *clock)
+
+
+def _parse_iso_datetime(text: str) -> datetime | None:
+    # Cached and exported rows carry ISO timestamps; fromisoformat reads them far
+    # faster than dateutil.
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
 def parse_event_datetime(value: str | None, tzname: str, *, date_value: str | None = None, time_value: str | None = None) -> datetime | None:
     tz = gettz(tzname)
     text = clean(value)
     try:
         if text:
-            dt = date_parser.parse(text)
+            dt = _parse_iso_datetime(text) or date_parser.parse(text)
         elif date_value:
             date_text = clean(date_value)
             time_text = clean(time_value) or "12:00am"
-            dt = date_parser.parse(f"{date_text} {time_text}")
+            dt = _parse_date_and_clock(date_text, time_text) or date_parser.parse(f"{date_text} {time_text}")
         else:
             return None
     except (ValueError, TypeError, OverflowError):
@@ -65,8 +104,9 @@ def normalize_event(raw: dict, tzname: str, default_source: str = "") -> dict:
     )
     datetime_local = dt.isoformat() if dt else clean(raw.get("datetime_local"))
     datetime_utc = dt.astimezone(timezone.utc).isoformat() if dt else clean(raw.get("datetime_utc"))
-    date = dt.date().isoformat() if dt else clean(raw.get("date") or raw.get("Date"))
-    time = dt.strftime("%H:%M:%S") if dt else clean(raw.get("time") or raw.get("Time"))
+    # isoformat() is always "YYYY-MM-DDTHH:MM:SS...", so date and time are fixed slices of it.
+    date = datetime_local[:10] if dt else clean(raw.get("date") or raw.get("Date"))
+    time = datetime_local[11:19] if dt else clean(raw.get("time") or raw.get("Time"))
 
     currency = clean(raw.get("currency") or raw.get("country") or raw.get("Country") or raw.get("Currency")).upper()
     impact = clean(raw.get("impact") or raw.get("Impact"))
@@ -131,5 +171,5 @@ def parse_ics_datetime(value: str, tzname: str) -> datetime | None:
     except ValueError:
         try:
             return parsedate_to_datetime(value).astimezone(gettz(tzname))
-        except Exception:
+        except (TypeError, ValueError):
             return None
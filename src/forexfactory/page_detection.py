@@ -1,8 +1,6 @@
-import re
-
-
 def normalize_text(value: str | None) -> str:
-    return re.sub(r"\s+", " ", value or "").strip()
+    # str.split() splits on the same whitespace as r"\s+" and drops the ends, without the regex engine.
+    return " ".join((value or "").split())
 
 
 def detect_page_issue(title: str = "", body_text: str = "", source: str = "") -> str | None:
@@ -8,6 +8,7 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 from io import StringIO
 
+from ..date_logic import ff_week_date
 from ..normalizer import normalize_events, parse_ics_datetime
 from .base import ProviderError
 from .http import classify_http_calendar, discover_export_links, dump_http_debug, fetch_url
@@ -16,6 +17,10 @@ logger = logging.getLogger(__name__)
 
 EXPORT_FORMATS = {"json", "csv", "xml", "ics"}
 
+_SUMMARY_PREFIX_RE = re.compile(r"^[^\w]+")
+_DESC_VALUE_RES = {key: re.compile(rf"{key}:\s*([^\n]+)") for key in ("Impact", "Forecast", "Previous")}
+_DESC_URL_RE = re.compile(r"https?://\S+")
+
 
 class ForexFactoryExportProvider:
     name = "forexfactory-export"
@@ -28,7 +33,7 @@ class ForexFactoryExportProvider:
         self.timeout = timeout
 
     def fetch_events(self, start_date: datetime, end_date: datetime, tzname: str, **kwargs) -> list[dict]:
-        calendar_url = f"https://www.forexfactory.com/calendar?week={start_date.strftime('%b%d.%Y').lower()}"
+        calendar_url = f"https://www.forexfactory.com/calendar?week={ff_week_date(start_date)}"
         logger.info("Discovering ForexFactory export links from %s", calendar_url)
         page = fetch_url(calendar_url, timeout=self.timeout)
         links = discover_export_links(page.text, page.final_url)
@@ -49,9 +54,10 @@ class ForexFactoryExportProvider:
             raise ProviderError("export_endpoint_blocked", f"Export endpoint returned HTTP {result.status_code}: {export_url}")
         raw_events = self._parse_export(result.text, tzname)
         events = normalize_events(raw_events, tzname, default_source="forexfactory-export")
+        first_day, last_day = start_date.date().isoformat(), end_date.date().isoformat()
         filtered = [
             event for event in events
-            if event.get("date") and start_date.date().isoformat() <= event["date"] <= end_date.date().isoformat()
+            if event.get("date") and first_day <= event["date"] <= last_day
         ]
         if raw_events and not filtered and any("ff_calendar_thisweek" in link for link in links):
             sample_dates = sorted({event.get("date", "") for event in events if event.get("date")})
@@ -145,7 +151,7 @@ class ForexFactoryExportProvider:
             dt = parse_ics_datetime(item.get("DTSTART", ""), tzname)
             summary = item.get("SUMMARY", "")
             parsed.append({
-                "title": re.sub(r"^[^\w]+", "", summary).strip(),
+                "title": _SUMMARY_PREFIX_RE.sub("", summary).strip(),
                 "datetime": dt.isoformat() if dt else "",
                 "impact": _desc_value(description, "Impact"),
                 "forecast": _desc_value(description, "Forecast"),
@@ -167,10 +173,10 @@ def _unfold_ics(text: str) -> list[str]:
 
 
 def _desc_value(description: str, key: str) -> str:
-    match = re.search(rf"{re.escape(key)}:\s*([^\n]+)", description)
+    match = _DESC_VALUE_RES[key].search(description)
     return match.group(1).strip() if match else ""
 
 
 def _desc_url(description: str) -> str:
-    match = re.search(r"https?://\S+", description)
+    match = _DESC_URL_RE.search(description)
     return match.group(0).strip() if match else ""
@@ -1,27 +1,37 @@
 from __future__ import annotations
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from html import unescape
 from html.parser import HTMLParser
 from urllib.parse import urljoin
 
+from dateutil.tz import gettz
+
+from ..date_logic import ff_week_date
 from ..normalizer import normalize_events
 from ..page_detection import normalize_text
 from .base import ProviderError
 from .http import (
+    HttpCache,
+    HttpSession,
     calendar_rows_present,
     classify_http_calendar,
     discover_export_links,
     dump_http_debug,
-    fetch_url,
 )
 
 logger = logging.getLogger(__name__)
 
-
-def _ff_date(dt: datetime) -> str:
-    return dt.strftime("%b%d.%Y").lower()
+_CELL_CLASS_RE = re.compile(r"calendar__(time|currency|impact|event|actual|forecast|previous|date)")
+_IMPACT_ICON_RE = re.compile(r"icon--ff-impact-(red|ora|yel|gra)")
+_IMPACT_ICON_LABELS = {"red": "High", "ora": "Medium", "yel": "Low", "gra": "Non-Economic"}
+_CALENDAR_TABLE_START_RE = re.compile(r"""<table\b[^>]*\bclass=["'][^"']*\bcalendar__table""", re.I)
+_FEED_CHUNK_SIZE = 64 * 1024
+_TRACKED_TAGS = frozenset({"table", "tr", "td", "span", "a"})
+_DAY_TEXT_RE = re.compile(r"\b([A-Za-z]{3})\s+(\d{1,2})\b")
 
 
 def iter_weeks(start_date: datetime, end_date: datetime):
@@ -32,88 +42,133 @@ def iter_weeks(start_date: datetime, end_date: datetime):
 
 
 class _CalendarTableParser(HTMLParser):
-    def __init__(self):
+    def __init__(self, single_table: bool = False):
         super().__init__(convert_charrefs=True)
         self.rows: list[dict] = []
         self.current_row: dict | None = None
         self.current_cell: str | None = None
-        self.current_link: str = ""
-        self.current_day_text = ""
+        self.nested_tables = 0
+        # With single_table, everything after the first table closes is ignored.
+        # Counting tags here, not in the raw text, skips "</table>" inside scripts and comments.
+        self.single_table = single_table
+        self.table_depth = 0
+        self.finished = False
 
     def handle_starttag(self, tag, attrs):
+        if tag not in _TRACKED_TAGS or self.finished:
+            return
+        if tag == "table":
+            self.table_depth += 1
+            # Tables nested inside a row (e.g. expanded details) must not end the row early.
+            if self.current_row is not None:
+                self.nested_tables += 1
+        if self.nested_tables:
+            return
         attrs_dict = dict(attrs)
         class_name = attrs_dict.get("class", "")
         if tag == "tr" and "calendar__row" in class_name:
             self.current_row = {"_class": class_name, "_cells": {}, "detail_url": "", "_dateline": attrs_dict.get("data-day-dateline", "")}
-            self.current_day_text = ""
         if self.current_row is None:
             return
         if tag == "td":
-            for name in ("time", "currency", "impact", "event", "actual", "forecast", "previous", "date"):
-                if f"calendar__{name}" in class_name:
-                    self.current_cell = name
-                    break
+            match = _CELL_CLASS_RE.search(class_name)
+            if match:
+                self.current_cell = match.group(1)
         if tag == "span" and self.current_cell == "impact":
             title = attrs_dict.get("title")
             if title:
                 self.current_row["_cells"]["impact"] = title
-            elif "icon--ff-impact-red" in class_name:
-                self.current_row["_cells"]["impact"] = "High"
-            elif "icon--ff-impact-ora" in class_name:
-                self.current_row["_cells"]["impact"] = "Medium"
-            elif "icon--ff-impact-yel" in class_name:
-                self.current_row["_cells"]["impact"] = "Low"
-            elif "icon--ff-impact-gra" in class_name:
-                self.current_row["_cells"]["impact"] = "Non-Economic"
+            else:
+                match = _IMPACT_ICON_RE.search(class_name)
+                if match:
+                    self.current_row["_cells"]["impact"] = _IMPACT_ICON_LABELS[match.group(1)]
         if tag == "a":
             href = attrs_dict.get("href", "")
-            if href:
-                self.current_link = href
-                if self.current_cell in {"event", "impact"} or "calendar/" in href:
-                    self.current_row["detail_url"] = href
+            if href and (self.current_cell in {"event", "impact"} or "calendar/" in href):
+                self.current_row["detail_url"] = href
 
     def handle_data(self, data):
-        if self.current_row is None:
+        if self.current_row is None or self.nested_tables or self.finished:
             return
         text = normalize_text(data)
         if not text:
             return
         if self.current_cell:
             current = self.current_row["_cells"].get(self.current_cell, "")
-            self.current_row["_cells"][self.current_cell] = normalize_text(f"{current} {text}")
+            # Both parts are already normalized, so joining them needs no second pass.
+            self.current_row["_cells"][self.current_cell] = f"{current} {text}" if current else text
 
     def handle_endtag(self, tag):
+        if self.finished:
+            return
+        if tag == "table":
+            self.table_depth = max(self.table_depth - 1, 0)
+            if self.single_table and self.table_depth == 0:
+                self.finished = True
+        if self.nested_tables:
+            if tag == "table":
+                self.nested_tables -= 1
+            return
         if tag == "td":
             self.current_cell = None
-        if tag == "a":
-            self.current_link = ""
         if tag == "tr" and self.current_row is not None:
-            self.rows.append(self.current_row)
+            # Spacer rows carry neither cells nor a dateline; drop them here so
+            # parse_calendar_html only sees rows that can set a day or yield an event.
+            if self.current_row["_cells"] or self.current_row["_dateline"]:
+                self.rows.append(self.current_row)
             self.current_row = None
             self.current_cell = None
 
 
-def parse_calendar_html(html: str, base_url: str, fallback_date: datetime, tzname: str) -> list[dict]:
+def _parse_calendar_rows(html: str) -> list[dict]:
+    # Anchor on the table's own start tag; the class name also shows up in scripts and CSS.
+    match = _CALENDAR_TABLE_START_RE.search(html)
+    if match is not None:
+        parser = _CalendarTableParser(single_table=True)
+        # Feed in chunks so the page chrome after the table is never tokenized.
+        for offset in range(match.start(), len(html), _FEED_CHUNK_SIZE):
+            parser.feed(html[offset:offset + _FEED_CHUNK_SIZE])
+            if parser.finished:
+                break
+        if parser.rows:
+            return parser.rows
+    # No calendar table, or the slice missed the rows (unexpected markup); parse the whole page as before.
     parser = _CalendarTableParser()
     parser.feed(html)
+    return parser.rows
+
+
+def parse_calendar_html(html: str, base_url: str, fallback_date: datetime, tzname: str) -> list[dict]:
     events = []
+    tz = gettz(tzname)
     current_day = fallback_date
+    day_iso = current_day.date().isoformat()
+    last_dateline = ""
+    dateline_day = None
     last_time = ""
-    for row in parser.rows:
+    for row in _parse_calendar_rows(html):
         row_class = row.get("_class", "")
         cells = row.get("_cells", {})
         dateline = row.get("_dateline")
         if dateline:
-            try:
-                current_day = datetime.fromtimestamp(int(dateline), tz=current_day.tzinfo)
+            # Rows of a day repeat the same dateline, so convert each value only once.
+            if dateline != last_dateline:
+                last_dateline = dateline
+                try:
+                    dateline_day = datetime.fromtimestamp(int(dateline), tz=current_day.tzinfo)
+                    dateline_iso = dateline_day.date().isoformat()
+                except (TypeError, ValueError, OSError):
+                    dateline_day = None
+            if dateline_day is not None:
+                current_day = dateline_day
+                day_iso = dateline_iso
                 last_time = ""
-            except (TypeError, ValueError, OSError):
-                pass
         day_text = cells.get("date", "")
         if day_text:
-            parsed = _parse_day_text(day_text, current_day, tzname)
+            parsed = _parse_day_text(day_text, current_day, tz)
             if parsed is not None:
                 current_day = parsed
+                day_iso = current_day.date().isoformat()
                 last_time = ""
         if "day-breaker" in row_class or "no-event" in row_class:
             continue
@@ -125,7 +180,7 @@ def parse_calendar_html(html: str, base_url: str, fallback_date: datetime, tznam
         if cells.get("time"):
             last_time = cells.get("time", "")
         events.append({
-            "date": current_day.date().isoformat(),
+            "date": day_iso,
             "time": time_text,
             "currency": currency,
             "impact": cells.get("impact", ""),
@@ -133,59 +188,73 @@ def parse_calendar_html(html: str, base_url: str, fallback_date: datetime, tznam
             "actual": cells.get("actual", ""),
             "forecast": cells.get("forecast", ""),
             "previous": cells.get("previous", ""),
-            "detail_url": urljoin(base_url, row.get("detail_url", "")) if row.get("detail_url") else "",
+            "detail_url": urljoin(base_url, row["detail_url"]) if row["detail_url"] else "",
             "source_url": base_url,
             "source": "forexfactory-html",
         })
     return normalize_events(events, tzname, default_source="forexfactory-html")
 
 
-def _parse_day_text(text: str, fallback_date: datetime, tzname: str) -> datetime | None:
-    from datetime import datetime as dt
-    from dateutil.tz import gettz
-    import re
-
-    match = re.search(r"\b([A-Za-z]{3})\s+(\d{1,2})\b", text)
+def _parse_day_text(text: str, fallback_date: datetime, tz) -> datetime | None:
+    match = _DAY_TEXT_RE.search(text)
     if not match:
         return None
     month_text, day_text = match.groups()
     try:
-        parsed = dt.strptime(f"{month_text} {int(day_text)} {fallback_date.year}", "%b %d %Y")
+        parsed = datetime.strptime(f"{month_text} {int(day_text)} {fallback_date.year}", "%b %d %Y")
     except ValueError:
         return None
     if fallback_date.month == 12 and parsed.month == 1:
         parsed = parsed.replace(year=fallback_date.year + 1)
     elif fallback_date.month == 1 and parsed.month == 12:
         parsed = parsed.replace(year=fallback_date.year - 1)
-    return parsed.replace(tzinfo=gettz(tzname))
+    return parsed.replace(tzinfo=tz)
 
 
 class ForexFactoryHtmlProvider:
     name = "forexfactory-html"
 
-    def __init__(self, debug: bool = False, timeout: int = 30):
+    def __init__(self, debug: bool = False, timeout: int = 15, max_workers: int = 4, cache_dir: str | None = None):
         self.debug = debug
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = HttpCache(cache_dir) if cache_dir else None
 
     def fetch_events(self, start_date: datetime, end_date: datetime, tzname: str, **kwargs) -> list[dict]:
-        events: list[dict] = []
-        for week in iter_weeks(start_date, end_date):
-            url = f"https://www.forexfactory.com/calendar?week={_ff_date(week)}"
-            logger.info("Fetching ForexFactory HTML: %s", url)
-            result = fetch_url(url, timeout=self.timeout)
-            export_links = discover_export_links(result.text, result.final_url)
-            issue = classify_http_calendar(result)
-            if issue:
-                if self.debug:
-                    dump_http_debug(result, issue, f"http_calendar_{week.date().isoformat()}", export_links)
-                raise ProviderError(issue, f"ForexFactory HTML fetch returned {issue} for {url}.")
-            if not calendar_rows_present(result.text):
-                if self.debug:
-                    dump_http_debug(result, "calendar_selector_missing", f"http_calendar_{week.date().isoformat()}", export_links)
-                raise ProviderError("calendar_selector_missing", f"Calendar rows were not found in fetched HTML for {url}.")
-            events.extend(parse_calendar_html(result.text, result.final_url, week, tzname))
+        # Weeks are independent pages, so fetch them concurrently; map() keeps week order
+        # and re-raises the first failing week's ProviderError. One session per run lets
+        # each worker reuse its connection for the weeks it fetches.
+        weeks = list(iter_weeks(start_date, end_date))
+        workers = max(1, min(self.max_workers, len(weeks)))
+        session = HttpSession(timeout=self.timeout, cache=self.cache)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = executor.map(lambda week: self._fetch_week(session, week, tzname), weeks)
+                events = [event for page in pages for event in page]
+        finally:
+            session.close()
 
+        first_day, last_day = start_date.date().isoformat(), end_date.date().isoformat()
         return [
             event for event in events
-            if event.get("datetime_local") and start_date.date().isoformat() <= event["date"] <= end_date.date().isoformat()
+            if event.get("datetime_local") and first_day <= event["date"] <= last_day
         ]
+
+    def _fetch_week(self, session: HttpSession, week: datetime, tzname: str) -> list[dict]:
+        url = f"https://www.forexfactory.com/calendar?week={ff_week_date(week)}"
+        logger.info("Fetching ForexFactory HTML: %s", url)
+        result = session.fetch(url)
+        issue = classify_http_calendar(result)
+        if issue:
+            self._dump_debug(result, issue, week)
+            raise ProviderError(issue, f"ForexFactory HTML fetch returned {issue} for {url}.")
+        if not calendar_rows_present(result.text):
+            self._dump_debug(result, "calendar_selector_missing", week)
+            raise ProviderError("calendar_selector_missing", f"Calendar rows were not found in fetched HTML for {url}.")
+        return parse_calendar_html(result.text, result.final_url, week, tzname)
+
+    def _dump_debug(self, result, reason: str, week: datetime):
+        # Export links are only reported in debug artifacts, so only scan for them here.
+        if self.debug:
+            export_links = discover_export_links(result.text, result.final_url)
+            dump_http_debug(result, reason, f"http_calendar_{week.date().isoformat()}", export_links)
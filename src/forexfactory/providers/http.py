@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.client
+import http.cookiejar
+import json
+import os
 import re
+import tempfile
+import threading
+import zlib
 from dataclasses import dataclass
 from html import unescape
 from pathlib import Path
 from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from urllib.request import Request, getproxies, urlopen
 
 from ..page_detection import detect_page_issue, normalize_text
 
@@ -14,8 +23,16 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/149.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
 }
 
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_SCRIPT_RE = re.compile(r"<script\b.*?</script>", re.I | re.S)
+_STYLE_RE = re.compile(r"<style\b.*?</style>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_LINK_RE = re.compile(r"""(?:href|src)=["']([^"']+)["']""", re.I)
+_EXPORT_LINK_RE = re.compile(r"(\.ics|\.csv|\.json|\.xml|nfs\.faireconomy\.media|ff_calendar)", re.I)
+
 
 @dataclass
 class HttpResult:
@@ -34,41 +51,229 @@ def http_debug_artifact_paths(debug_name: str, debug_dir: str = "debug") -> dict
     }
 
 
-def fetch_url(url: str, headers: dict | None = None, timeout: int = 30) -> HttpResult:
-    req = Request(url, headers=headers or DEFAULT_HEADERS)
+def decode_body(body: bytes, content_encoding: str | None) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class HttpCache:
+    """
+    On-disk store of response bodies and their validators (ETag / Last-Modified).
+
+    fetch_url uses it to send conditional requests and to reuse the stored body
+    when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory).expanduser()
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> dict | None:
+        try:
+            entry = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get("url") == url else None
+
+    def put(self, url: str, etag: str, last_modified: str, result: HttpResult):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "status_code": result.status_code,
+            "final_url": result.final_url,
+            "content_type": result.content_type,
+            "text": result.text,
+        }
+        fd, tmp_path = tempfile.mkstemp(prefix=".http-cache-", suffix=".json", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _conditional_headers(headers: dict, cached: dict | None) -> dict:
+    request_headers = dict(headers)
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+    return request_headers
+
+
+def _build_result(
+    url: str,
+    status_code: int,
+    final_url: str,
+    response_headers,
+    body: bytes,
+    cache: HttpCache | None,
+    cached: dict | None,
+) -> HttpResult:
+    if status_code == 304 and cached:
+        return HttpResult(url, cached["status_code"], cached["final_url"], cached["content_type"], cached["text"])
+
+    response_headers = response_headers or {}
+    content_type = response_headers.get("content-type", "")
+    try:
+        body = decode_body(body, response_headers.get("content-encoding", ""))
+    except (EOFError, OSError, zlib.error) as exc:
+        # gzip.BadGzipFile is an OSError; a truncated stream raises EOFError.
+        raise RuntimeError(f"Could not decode {url}: {exc}") from exc
+    result = HttpResult(url, status_code, final_url, content_type, body.decode("utf-8", "replace"))
+    etag = response_headers.get("etag", "")
+    last_modified = response_headers.get("last-modified", "")
+    if cache is not None and status_code == 200 and (etag or last_modified):
+        cache.put(url, etag, last_modified, result)
+    return result
+
+
+def fetch_url(url: str, headers: dict | None = None, timeout: int = 30, cache: HttpCache | None = None) -> HttpResult:
+    cached = cache.get(url) if cache is not None else None
+    req = Request(url, headers=_conditional_headers(headers or DEFAULT_HEADERS, cached))
     try:
         with urlopen(req, timeout=timeout) as response:
             body = response.read()
             status_code = response.status
             final_url = response.geturl()
-            content_type = response.headers.get("content-type", "")
+            response_headers = response.headers
     except HTTPError as exc:
         body = exc.read()
         status_code = exc.code
         final_url = exc.geturl()
-        content_type = exc.headers.get("content-type", "") if exc.headers else ""
+        response_headers = exc.headers
     except URLError as exc:
         raise RuntimeError(f"Could not fetch {url}: {exc}") from exc
-    return HttpResult(url, status_code, final_url, content_type, body.decode("utf-8", "replace"))
+    return _build_result(url, status_code, final_url, response_headers, body, cache, cached)
+
+
+class HttpSession:
+    """
+    Fetch URLs over persistent HTTP/1.1 connections.
+
+    Each thread keeps one open connection per host, so a worker pool reuses its
+    TCP/TLS connections across pages instead of reconnecting for every request the
+    way fetch_url does. Cookies set by the site (e.g. bot-protection clearance) are
+    kept in a shared jar and sent with later requests of the same session. When
+    proxies are configured in the environment the session falls back to fetch_url,
+    which honours them.
+    """
+
+    max_redirects = 5
+
+    def __init__(self, headers: dict | None = None, timeout: int = 15, cache: HttpCache | None = None):
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.timeout = timeout
+        self.cache = cache
+        self.cookies = http.cookiejar.CookieJar()
+        self._use_urllib = bool(getproxies())
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[http.client.HTTPConnection] = []
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        connections = self._local.__dict__.setdefault("connections", {})
+        conn = connections.get((scheme, netloc))
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(netloc, timeout=self.timeout)
+            connections[(scheme, netloc)] = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _request(self, url: str, headers: dict):
+        parts = urlsplit(url)
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        conn = self._connection(parts.scheme, parts.netloc)
+        cookie_request = Request(url)
+        self.cookies.add_cookie_header(cookie_request)
+        cookie = cookie_request.get_header("Cookie")
+        if cookie:
+            headers = {**headers, "Cookie": cookie}
+        # A kept-alive connection may have been closed by the server while idle;
+        # reconnect once in that case.
+        for attempt in range(2):
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                self.cookies.extract_cookies(response, cookie_request)
+                return response.status, response.headers, body
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+            except (OSError, http.client.HTTPException):
+                # Leave no half-read response behind; the next request reconnects.
+                conn.close()
+                raise
+
+    def _get(self, url: str, headers: dict):
+        final_url = url
+        for _ in range(self.max_redirects + 1):
+            status_code, response_headers, body = self._request(final_url, headers)
+            location = response_headers.get("location")
+            if status_code not in (301, 302, 303, 307, 308) or not location:
+                break
+            final_url = urljoin(final_url, location)
+        return status_code, final_url, response_headers, body
+
+    def fetch(self, url: str) -> HttpResult:
+        if self._use_urllib:
+            return fetch_url(url, headers=self.headers, timeout=self.timeout, cache=self.cache)
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = _conditional_headers(self.headers, cached)
+        try:
+            try:
+                status_code, final_url, response_headers, body = self._get(url, headers)
+            except TimeoutError:
+                # A single slow response is usually transient; retry once on a fresh
+                # connection rather than waiting out a longer timeout.
+                status_code, final_url, response_headers, body = self._get(url, headers)
+        except (OSError, http.client.HTTPException) as exc:
+            raise RuntimeError(f"Could not fetch {url}: {exc}") from exc
+        return _build_result(url, status_code, final_url, response_headers, body, self.cache, cached)
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
 
 
 def extract_title(html: str) -> str:
-    match = re.search(r"<title[^>]*>(.*?)</title>", html, re.I | re.S)
+    match = _TITLE_RE.search(html)
     return normalize_text(unescape(match.group(1))) if match else ""
 
 
 def body_text(html: str) -> str:
-    text = re.sub(r"<script\b.*?</script>", " ", html, flags=re.I | re.S)
-    text = re.sub(r"<style\b.*?</style>", " ", text, flags=re.I | re.S)
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _SCRIPT_RE.sub(" ", html)
+    text = _STYLE_RE.sub(" ", text)
+    text = _TAG_RE.sub(" ", text)
     return normalize_text(unescape(text))
 
 
 def discover_export_links(html: str, base_url: str) -> list[str]:
     links = []
-    for match in re.finditer(r"""(?:href|src)=["']([^"']+)["']""", html, re.I):
+    for match in _LINK_RE.finditer(html):
         href = unescape(match.group(1))
-        if re.search(r"(\.ics|\.csv|\.json|\.xml|nfs\.faireconomy\.media|ff_calendar)", href, re.I):
+        if _EXPORT_LINK_RE.search(href):
             links.append(urljoin(base_url, href))
     return sorted(set(links))
 
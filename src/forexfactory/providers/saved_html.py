@@ -28,7 +28,8 @@ class SavedHtmlProvider:
         events = parse_calendar_html(html, "https://www.forexfactory.com/calendar", start_date, tzname)
         if kwargs.get("all_dates"):
             return events
+        first_day, last_day = start_date.date().isoformat(), end_date.date().isoformat()
         return [
             event for event in events
-            if event.get("date") and start_date.date().isoformat() <= event["date"] <= end_date.date().isoformat()
+            if event.get("date") and first_day <= event["date"] <= last_day
         ]
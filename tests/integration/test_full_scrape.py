@@ -19,8 +19,9 @@ class TestFullScrape(unittest.TestCase):
             os.remove(self.output_file)
 
     def tearDown(self):
-        if os.path.exists(self.output_file):
-            os.remove(self.output_file)
+        for path in (self.output_file, self.output_file + ".meta.json"):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_cached_dataset_shape(self):
         cache_file = Path("forex_factory_cache.csv")
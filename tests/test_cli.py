@@ -1,10 +1,17 @@
-from src.forexfactory.main import parse_args
+from datetime import datetime
+
+import pandas as pd
+from dateutil.tz import gettz
+
+from src.forexfactory.csv_util import normalize_calendar_frame, write_data_to_csv
+from src.forexfactory.main import _resume_start, parse_args
 
 
 def test_default_provider_is_html():
     args = parse_args(["--start", "2025-04-07", "--end", "2025-04-14"])
 
     assert args.provider == "forexfactory-html"
+    assert args.workers == 4
 
 
 def test_parse_provider_options():
@@ -38,6 +45,8 @@ def test_parse_common_cache_options():
         "--details",
         "--impact", "high,medium",
         "--keep-currencies", "USD", "EUR",
+        "--workers", "2",
+        "--resume",
         "--debug",
     ])
 
@@ -46,4 +55,42 @@ def test_parse_common_cache_options():
     assert args.details is True
     assert args.impact == "high,medium"
     assert args.keep_currencies == ["USD", "EUR"]
+    assert args.workers == 2
+    assert args.resume is True
     assert args.debug is True
+
+
+def _write_cache(path, days):
+    rows = pd.DataFrame([
+        {"DateTime": f"{day}T16:00:00+03:30", "Currency": "USD", "Event": f"CPI {day}"}
+        for day in days
+    ])
+    write_data_to_csv(normalize_calendar_frame(rows), str(path))
+
+
+def test_resume_skips_leading_cached_weeks(tmp_path):
+    tz = gettz("Asia/Tehran")
+    output = tmp_path / "cache.csv"
+    _write_cache(output, ["2025-04-07", "2025-04-15", "2025-04-23"])
+    start, end = datetime(2025, 4, 7, tzinfo=tz), datetime(2025, 4, 30, tzinfo=tz)
+
+    assert _resume_start(str(output), start, end) == datetime(2025, 4, 21, tzinfo=tz)
+    assert _resume_start(str(output), start, datetime(2025, 4, 18, tzinfo=tz)) == datetime(2025, 4, 14, tzinfo=tz)
+    assert _resume_start(str(tmp_path / "missing.csv"), start, end) == start
+
+
+def test_resume_does_not_skip_gaps_or_backfills(tmp_path):
+    tz = gettz("Asia/Tehran")
+    start, end = datetime(2025, 4, 7, tzinfo=tz), datetime(2025, 4, 30, tzinfo=tz)
+
+    gap = tmp_path / "gap.csv"
+    _write_cache(gap, ["2025-04-07", "2025-04-23"])
+    assert _resume_start(str(gap), start, end) == start
+
+    later = tmp_path / "later.csv"
+    _write_cache(later, ["2025-04-09", "2025-04-15", "2025-04-23"])
+    assert _resume_start(str(later), start, end) == start
+
+    backfill = tmp_path / "backfill.csv"
+    _write_cache(backfill, ["2025-06-01"])
+    assert _resume_start(str(backfill), datetime(2025, 1, 1, tzinfo=tz), datetime(2025, 1, 31, tzinfo=tz)) == datetime(2025, 1, 1, tzinfo=tz)
@@ -1,6 +1,20 @@
+import os
+
 import pandas as pd
+import pytest
 
-from src.forexfactory.csv_util import CSV_COLUMNS, merge_new_data, normalize_calendar_frame
+from src.forexfactory import csv_util
+from src.forexfactory.csv_util import (
+    CSV_COLUMNS,
+    append_data_to_csv,
+    csv_meta_path,
+    ensure_csv_header,
+    merge_new_data,
+    normalize_calendar_frame,
+    read_existing_data,
+    read_csv_meta,
+    write_data_to_csv,
+)
 
 
 def test_normalize_calendar_frame_sorts_and_prefers_detail():
@@ -50,3 +64,134 @@ def test_merge_new_data_updates_missing_detail_only():
 
     assert len(result) == 1
     assert result.iloc[0]["Detail"] == "Source: BLS"
+
+
+def test_merge_new_data_appends_new_rows_and_keeps_existing_detail():
+    existing = pd.DataFrame([
+        {"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Impact": "High", "Event": "Jobs", "Detail": "Source: BLS"},
+    ])
+    new = pd.DataFrame([
+        {"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Impact": "High", "Event": "Jobs", "Detail": "Other"},
+        {"DateTime": "2025-04-08T10:00:00+03:30", "Currency": "EUR", "Impact": "Low", "Event": "Retail", "Detail": ""},
+    ])
+
+    result = merge_new_data(existing, new)
+
+    assert result["Event"].tolist() == ["Jobs", "Retail"]
+    assert result.iloc[0]["Detail"] == "Source: BLS"
+
+
+def test_last_cache_datetimes_reads_tail(tmp_path, monkeypatch):
+    output = tmp_path / "cache.csv"
+    rows = [
+        {"DateTime": f"2025-04-{day:02d}T10:00:00+03:30", "Currency": "USD", "Impact": "High", "Event": f"Event {day}", "Detail": ""}
+        for day in range(1, 29)
+    ]
+    rows[-1]["Detail"] = "Source: BLS\nMeasures, among other things, jobs"
+    write_data_to_csv(pd.DataFrame(rows), str(output))
+    os.remove(csv_meta_path(str(output)))
+    monkeypatch.setattr(csv_util, "TAIL_CHUNK_SIZE", 64)
+
+    assert csv_util._last_cache_datetimes(str(output))[0] == "2025-04-28T10:00:00+03:30"
+
+
+@pytest.mark.parametrize("event, detail", [
+    ("Page\x0cBreak", ""),
+    ("Line\u2028Separator", ""),
+    ("Jobs", "Source: BLS\n1, 2, 3, 4, 5, 6, 7, 8"),
+    ("Jobs", 'Quoted "value"\n' + ",".join(["x"] * 30)),
+])
+def test_last_cache_datetimes_finds_record_boundary(tmp_path, monkeypatch, event, detail):
+    output = tmp_path / "cache.csv"
+    rows = [
+        {"DateTime": "2025-04-06T10:00:00+03:30", "Currency": "EUR", "Event": "Retail"},
+        {"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Event": event, "Detail": detail},
+    ]
+    write_data_to_csv(pd.DataFrame(rows), str(output))
+    os.remove(csv_meta_path(str(output)))
+
+    for chunk_size in (16, 64, 8192):
+        monkeypatch.setattr(csv_util, "TAIL_CHUNK_SIZE", chunk_size)
+        assert csv_util._last_cache_datetimes(str(output))[0] == "2025-04-07T10:00:00+03:30"
+
+
+def test_append_falls_back_when_last_row_is_unknown(tmp_path):
+    output = tmp_path / "cache.csv"
+    write_data_to_csv(pd.DataFrame([{"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Event": "Jobs"}]), str(output))
+    os.remove(csv_meta_path(str(output)))
+    with open(output, "a", encoding="utf-8") as f:
+        f.write("2025-04-09T10:00:00+03:30,USD,High,Edited by hand\n")
+    before = output.read_bytes()
+    new = pd.DataFrame([{"DateTime": "2025-04-08T10:00:00+03:30", "Currency": "USD", "Event": "CPI"}])
+
+    assert append_data_to_csv(new, str(output)) is None
+    assert output.read_bytes() == before
+
+
+def test_ensure_csv_header_fills_empty_file_and_keeps_existing(tmp_path):
+    output = tmp_path / "cache.csv"
+    output.write_text("", encoding="utf-8")
+
+    ensure_csv_header(str(output))
+    assert output.read_text(encoding="utf-8") == ",".join(CSV_COLUMNS) + "\n"
+
+    output.write_text("custom\n", encoding="utf-8")
+    ensure_csv_header(str(output))
+    assert output.read_text(encoding="utf-8") == "custom\n"
+
+
+def test_read_existing_data_keeps_literal_na_values(tmp_path):
+    output = tmp_path / "cache.csv"
+    df = pd.DataFrame([{"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Event": "Jobs", "Forecast": "N/A"}])
+    write_data_to_csv(normalize_calendar_frame(df), str(output))
+
+    result = read_existing_data(str(output))
+
+    assert result.iloc[0]["Forecast"] == "N/A"
+    assert result.iloc[0]["Actual"] == ""
+
+
+def test_rewrite_and_append_share_line_terminator(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "linesep", "\r\n")
+    output = tmp_path / "cache.csv"
+    write_data_to_csv(pd.DataFrame([{"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Event": "Jobs"}]), str(output))
+    new = pd.DataFrame([{"DateTime": "2025-04-08T10:00:00+03:30", "Currency": "USD", "Event": "CPI"}])
+
+    assert append_data_to_csv(new, str(output)) == 1
+    assert b"\r\n" not in output.read_bytes()
+
+
+def test_append_reports_rows_written_after_deduplication(tmp_path):
+    output = tmp_path / "cache.csv"
+    write_data_to_csv(pd.DataFrame([{"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Event": "Jobs"}]), str(output))
+    row = {"DateTime": "2025-04-08T10:00:00+03:30", "Currency": "USD", "Event": "CPI"}
+
+    assert append_data_to_csv(pd.DataFrame([row, row]), str(output)) == 1
+    assert len(read_existing_data(str(output))) == 2
+
+
+def test_write_data_to_csv_records_sidecar_meta(tmp_path):
+    output = tmp_path / "cache.csv"
+    df = pd.DataFrame([
+        {"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Impact": "High", "Event": "Jobs"},
+        {"DateTime": "2025-04-08T10:00:00+03:30", "Currency": "EUR", "Impact": "Low", "Event": "Retail"},
+    ])
+
+    write_data_to_csv(df, str(output))
+
+    meta = read_csv_meta(str(output))
+    assert meta["last_datetime"] == "2025-04-08T10:00:00+03:30"
+    assert meta["row_count"] == 2
+
+
+def test_stale_sidecar_meta_is_ignored(tmp_path):
+    output = tmp_path / "cache.csv"
+    df = pd.DataFrame([
+        {"DateTime": "2025-04-07T10:00:00+03:30", "Currency": "USD", "Impact": "High", "Event": "Jobs"},
+    ])
+    write_data_to_csv(df, str(output))
+    with open(output, "a", encoding="utf-8") as f:
+        f.write("2025-04-09T10:00:00+03:30,EUR,Low,Retail" + "," * (len(CSV_COLUMNS) - 4) + "\n")
+
+    assert read_csv_meta(str(output)) is None
+    assert csv_util._last_cache_datetimes(str(output))[0] == "2025-04-09T10:00:00+03:30"
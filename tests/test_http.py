@@ -0,0 +1,180 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.forexfactory.providers.http import HttpCache, HttpSession, fetch_url
+
+
+class _EtagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen: list = []
+    client_ports: list = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.headers.get("If-None-Match"))
+        self.client_ports.append(self.client_address[1])
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'<table class="calendar__table"></table>'
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Return a function that serves a handler class on localhost and returns its base URL."""
+    servers = []
+
+    def serve(handler_class):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def etag_server(http_server):
+    _EtagHandler.requests_seen = []
+    _EtagHandler.client_ports = []
+    return http_server(_EtagHandler) + "/calendar?week=apr07.2025"
+
+
+def test_fetch_url_reuses_cached_body_on_not_modified(tmp_path, etag_server):
+    cache = HttpCache(tmp_path / "http-cache")
+
+    first = fetch_url(etag_server, cache=cache)
+    second = fetch_url(etag_server, cache=cache)
+
+    assert _EtagHandler.requests_seen == [None, '"v1"']
+    assert second.status_code == 200
+    assert second.text == first.text
+
+
+def test_http_session_reuses_connection_and_cache(tmp_path, etag_server, monkeypatch):
+    monkeypatch.setattr("src.forexfactory.providers.http.getproxies", lambda: {})
+    session = HttpSession(cache=HttpCache(tmp_path / "http-cache"))
+
+    try:
+        first = session.fetch(etag_server)
+        second = session.fetch(etag_server)
+    finally:
+        session.close()
+
+    assert _EtagHandler.requests_seen == [None, '"v1"']
+    assert len(set(_EtagHandler.client_ports)) == 1
+    assert second.text == first.text
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    cookies_seen: list = []
+
+    def do_GET(self):
+        self.cookies_seen.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "clearance=ok; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_http_session_sends_cookies_set_by_earlier_responses(http_server, monkeypatch):
+    monkeypatch.setattr("src.forexfactory.providers.http.getproxies", lambda: {})
+    _CookieHandler.cookies_seen = []
+    url = http_server(_CookieHandler) + "/calendar"
+    session = HttpSession()
+
+    try:
+        session.fetch(url)
+        session.fetch(url)
+    finally:
+        session.close()
+
+    assert _CookieHandler.cookies_seen == [None, "clearance=ok"]
+
+
+class _SlowOnceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_seen = 0
+    release = threading.Event()
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        if self.requests_seen == 1:
+            # Hold the first response until the test is done, well past the client timeout.
+            self.release.wait(timeout=10)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def test_http_session_retries_once_after_timeout(http_server, monkeypatch):
+    monkeypatch.setattr("src.forexfactory.providers.http.getproxies", lambda: {})
+    _SlowOnceHandler.requests_seen = 0
+    _SlowOnceHandler.release = threading.Event()
+    url = http_server(_SlowOnceHandler) + "/calendar"
+    session = HttpSession(timeout=0.2)
+
+    try:
+        result = session.fetch(url)
+    finally:
+        _SlowOnceHandler.release.set()
+        session.close()
+
+    assert result.text == "ok"
+    assert _SlowOnceHandler.requests_seen == 2
+
+
+class _BadGzipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"not gzip"
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_undecodable_body_raises_runtime_error(http_server, monkeypatch):
+    monkeypatch.setattr("src.forexfactory.providers.http.getproxies", lambda: {})
+    url = http_server(_BadGzipHandler) + "/calendar"
+    session = HttpSession()
+
+    try:
+        with pytest.raises(RuntimeError, match="Could not decode"):
+            fetch_url(url)
+        with pytest.raises(RuntimeError, match="Could not decode"):
+            session.fetch(url)
+    finally:
+        session.close()
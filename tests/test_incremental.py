@@ -3,6 +3,7 @@ from datetime import datetime
 import pandas as pd
 from dateutil.tz import gettz
 
+from src.forexfactory.csv_util import read_csv_meta, write_data_to_csv
 from src.forexfactory.incremental import scrape_incremental
 
 
@@ -76,3 +77,33 @@ def test_scrape_incremental_preserves_existing_history(tmp_path):
     df = pd.read_csv(output, dtype=str)
 
     assert set(df["DateTime"]) == {"2025-04-06T09:00:00+03:30", "2025-04-07T10:00:00+03:30"}
+
+
+def test_scrape_incremental_leaves_cache_untouched_without_events(tmp_path):
+    output = tmp_path / "cache.csv"
+    output.write_text("DateTime,Currency,Impact,Event,Actual,Forecast,Previous,Detail\n2025-04-06T09:00:00+03:30,EUR,Low,Old,,,,\n", encoding="utf-8")
+    before = output.read_bytes()
+    tz = gettz("Asia/Tehran")
+    start = datetime(2025, 4, 7, tzinfo=tz)
+
+    scrape_incremental(start, start, str(output), tzname="Asia/Tehran", provider=DummyProvider([]))
+
+    assert output.read_bytes() == before
+
+
+def test_scrape_incremental_appends_newer_rows_like_a_full_merge(tmp_path):
+    appended = tmp_path / "appended.csv"
+    rewritten = tmp_path / "rewritten.csv"
+    tz = gettz("Asia/Tehran")
+    first = DummyProvider([_event("2025-04-07T10:00:00+03:30", "USD", "Jobs")])
+    second = DummyProvider([
+        _event("2025-04-08T11:00:00+03:30", "EUR", "Retail"),
+        _event("2025-04-08T09:00:00+03:30", "GBP", "CPI"),
+    ])
+
+    scrape_incremental(datetime(2025, 4, 7, tzinfo=tz), datetime(2025, 4, 7, tzinfo=tz), str(appended), provider=first)
+    scrape_incremental(datetime(2025, 4, 8, tzinfo=tz), datetime(2025, 4, 8, tzinfo=tz), str(appended), provider=second)
+    write_data_to_csv(pd.DataFrame(first.events + second.events), str(rewritten))
+
+    assert appended.read_bytes() == rewritten.read_bytes()
+    assert read_csv_meta(str(appended))["row_count"] == 3
@@ -1,4 +1,4 @@
-from src.forexfactory.normalizer import normalize_event
+from src.forexfactory.normalizer import normalize_event, parse_event_datetime
 
 
 def test_normalize_event_populates_legacy_and_provider_fields():
@@ -22,3 +22,24 @@ def test_normalize_event_populates_legacy_and_provider_fields():
     assert row["event"] == "GDP"
     assert row["source"] == "forexfactory-export"
     assert row["DateTime"].startswith("2025-04-07T")
+
+
+def test_parse_event_datetime_clock_times():
+    assert parse_event_datetime(None, "Asia/Tehran", date_value="2025-04-07", time_value="12:30am").isoformat() == "2025-04-07T00:30:00+03:30"
+    assert parse_event_datetime(None, "Asia/Tehran", date_value="2025-04-07", time_value="12:30pm").hour == 12
+    assert parse_event_datetime(None, "Asia/Tehran", date_value="2025-04-07", time_value="8:15PM").hour == 20
+    assert parse_event_datetime(None, "Asia/Tehran", date_value="Apr 7 2025", time_value="8:15pm").hour == 20
+
+
+def test_parse_event_datetime_iso_timestamp_converts_timezone():
+    dt = parse_event_datetime("2025-04-07T08:30:00-04:00", "Asia/Tehran")
+
+    assert dt.isoformat() == "2025-04-07T16:00:00+03:30"
+
+
+def test_normalize_event_splits_local_date_and_time():
+    row = normalize_event({"title": "CPI", "country": "USD", "date": "2025-04-07", "time": "8:30pm"}, "Asia/Tehran")
+
+    assert row["date"] == "2025-04-07"
+    assert row["time"] == "20:30:00"
+    assert row["datetime_local"] == "2025-04-07T20:30:00+03:30"
@@ -1,10 +1,15 @@
+import gzip
+import zlib
 from datetime import datetime
 
+import pytest
 from dateutil.tz import gettz
 
+from src.forexfactory.providers import ForexFactoryHtmlProvider, ProviderError
+from src.forexfactory.providers import forexfactory_html
 from src.forexfactory.providers.forexfactory_export import ForexFactoryExportProvider
-from src.forexfactory.providers.forexfactory_html import parse_calendar_html
-from src.forexfactory.providers.http import discover_export_links
+from src.forexfactory.providers.forexfactory_html import _CalendarTableParser, parse_calendar_html
+from src.forexfactory.providers.http import HttpResult, decode_body, discover_export_links
 from src.forexfactory.providers.saved_html import SavedHtmlProvider
 
 
@@ -40,6 +45,14 @@ def test_export_link_discovery():
     assert len([link for link in links if "ff_calendar_thisweek" in link]) == 4
 
 
+def test_decode_body_handles_compressed_responses():
+    body = CALENDAR_HTML.encode("utf-8")
+
+    assert decode_body(gzip.compress(body), "gzip") == body
+    assert decode_body(zlib.compress(body), "deflate") == body
+    assert decode_body(body, "") == body
+
+
 def test_json_export_parsing():
     provider = ForexFactoryExportProvider("json")
     rows = provider._parse_json('[{"title":"GDP","country":"USD","date":"2025-04-07T08:30:00-04:00","impact":"High","forecast":"1","previous":"2","url":"https://example.test"}]')
@@ -81,6 +94,124 @@ def test_html_calendar_parsing():
     assert rows[0]["detail_url"].endswith("/calendar/1-test-event")
 
 
+def test_html_calendar_parsing_skips_page_chrome():
+    tz = gettz("Asia/Tehran")
+    html = (
+        '<html><head><title>Calendar</title></head><body><table class="sidebar"><tr class="calendar__row"><td class="calendar__currency">EUR</td><td class="calendar__event">Sidebar</td></tr></table>'
+        + CALENDAR_HTML
+        + '<table class="footer"><tr><td class="calendar__currency">GBP</td><td class="calendar__event">Footer</td></tr></table><script>var x = "<tr>";</script></body></html>'
+    )
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert len(rows) == 1
+    assert rows[0]["event"] == "Test Event"
+
+
+def test_html_calendar_parsing_ignores_class_name_outside_the_table_tag():
+    tz = gettz("Asia/Tehran")
+    html = '<table class="nav"><tr><td>Menu</td></tr></table><script>$(".calendar__table")</script>' + CALENDAR_HTML
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert [row["event"] for row in rows] == ["Test Event"]
+
+
+def test_html_calendar_parsing_falls_back_to_whole_page_without_rows_in_table():
+    tz = gettz("Asia/Tehran")
+    html = '<table class="calendar__table"></table>' + CALENDAR_HTML.replace('class="calendar__table"', 'class="calendar"')
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert [row["event"] for row in rows] == ["Test Event"]
+
+
+def test_html_calendar_parsing_ignores_table_tags_in_scripts_and_comments():
+    tz = gettz("Asia/Tehran")
+    html = CALENDAR_HTML.replace(
+        '<tr class="calendar__row" data-event-id="1">',
+        '<script>var s = "</table>";</script><!-- </table> --><tr class="calendar__row" data-event-id="1">',
+    )
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert [row["event"] for row in rows] == ["Test Event"]
+
+
+def test_html_calendar_parsing_keeps_last_row_with_nested_table():
+    tz = gettz("Asia/Tehran")
+    html = CALENDAR_HTML.replace(
+        '<td class="calendar__previous">0.7%</td>',
+        '<td class="calendar__detail"><table><tr><td>History</td></tr></table></td><td class="calendar__previous">0.7%</td>',
+    ) + '<table class="footer"><tr class="calendar__row"><td class="calendar__currency">GBP</td><td class="calendar__event">Footer</td></tr></table>'
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert [(row["event"], row["previous"]) for row in rows] == [("Test Event", "0.7%")]
+
+
+def test_calendar_parser_drops_spacer_rows():
+    parser = _CalendarTableParser()
+    parser.feed(CALENDAR_HTML.replace("</table>", '<tr class="calendar__row calendar__row--no-grid"><td class="calendar__cell"></td></tr></table>'))
+
+    assert [sorted(row["_cells"]) for row in parser.rows] == [
+        ["date"],
+        ["actual", "currency", "event", "forecast", "impact", "previous", "time"],
+    ]
+
+
+def test_html_calendar_impact_from_icon_class():
+    tz = gettz("Asia/Tehran")
+    html = CALENDAR_HTML.replace('<span title="High Impact Expected"></span>', '<span class="icon icon--ff-impact-ora"></span>')
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert rows[0]["impact"] == "Medium"
+
+
+def test_html_calendar_rows_with_a_dateline_do_not_inherit_the_previous_time():
+    tz = gettz("Asia/Tehran")
+    html = (
+        '<table class="calendar__table">'
+        '<tr class="calendar__row" data-day-dateline="1743971400"><td class="calendar__time">8:30am</td>'
+        '<td class="calendar__currency">USD</td><td class="calendar__event">CPI</td></tr>'
+        '<tr class="calendar__row" data-day-dateline="1743971400"><td class="calendar__time"></td>'
+        '<td class="calendar__currency">USD</td><td class="calendar__event">Core CPI</td></tr>'
+        "</table>"
+    )
+
+    rows = parse_calendar_html(html, "https://www.forexfactory.com/calendar", datetime(2025, 4, 7, tzinfo=tz), "Asia/Tehran")
+
+    assert [(row["date"], row["time"]) for row in rows] == [("2025-04-07", "08:30:00"), ("2025-04-07", "00:00:00")]
+
+
+def _weekly_calendar_result(session, url):
+    day = {"apr07.2025": "Mon Apr 7", "apr14.2025": "Mon Apr 14"}.get(url.rsplit("=", 1)[-1])
+    html = CALENDAR_HTML.replace("Mon Apr 7", day) if day else "<html><title>Performing security verification</title></html>"
+    return HttpResult(url, 200, url, "text/html", html)
+
+
+def test_html_provider_fetches_weeks_concurrently_in_order(monkeypatch):
+    monkeypatch.setattr(forexfactory_html.HttpSession, "fetch", _weekly_calendar_result)
+    tz = gettz("Asia/Tehran")
+    provider = ForexFactoryHtmlProvider(max_workers=2)
+
+    rows = provider.fetch_events(datetime(2025, 4, 7, tzinfo=tz), datetime(2025, 4, 18, tzinfo=tz), "Asia/Tehran")
+
+    assert [row["date"] for row in rows] == ["2025-04-07", "2025-04-14"]
+
+
+def test_html_provider_raises_first_failing_week(monkeypatch):
+    monkeypatch.setattr(forexfactory_html.HttpSession, "fetch", _weekly_calendar_result)
+    tz = gettz("Asia/Tehran")
+    provider = ForexFactoryHtmlProvider(max_workers=2)
+
+    with pytest.raises(ProviderError) as excinfo:
+        provider.fetch_events(datetime(2025, 4, 7, tzinfo=tz), datetime(2025, 4, 25, tzinfo=tz), "Asia/Tehran")
+
+    assert excinfo.value.reason == "security_verification"
+
+
 def test_saved_html_provider(tmp_path):
     path = tmp_path / "calendar.html"
     path.write_text(CALENDAR_HTML, encoding="utf-8")
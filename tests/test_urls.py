@@ -8,7 +8,7 @@ from dateutil.tz import gettz
 #   from src.forexfactory.main import build_url_for_partial_range, build_url_for_full_month
 #
 # یا اگر بعداً به فایل جدا مثلاً date_logic.py منتقل کردید، آن را اصلاح کنید.
-from src.forexfactory.date_logic import build_url_for_partial_range, build_url_for_full_month
+from src.forexfactory.date_logic import build_url_for_partial_range, build_url_for_full_month, ff_week_date
 
 
 class TestUrlBuilders(unittest.TestCase):
@@ -32,6 +32,10 @@ class TestUrlBuilders(unittest.TestCase):
         result = build_url_for_full_month(2025, 1)
         self.assertEqual(result, "month=jan.2025")
 
+    def test_ff_week_date(self):
+        result = ff_week_date(datetime(2025, 4, 7))
+        self.assertEqual(result, "apr07.2025")
+
 
 if __name__ == '__main__':
     unittest.main()